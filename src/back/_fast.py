@@ -0,0 +1,34 @@
+import numpy as np
+
+from numba import njit
+
+
+@njit(cache=True)
+def finite_rows(values: np.array) -> np.array:
+    """
+    Marks the rows of a 2D float64 array in which every value is finite.
+
+    Empty cells of an instrument export, typically on a last line cut short, are read
+    as NaN; the rows holding them are found here in a single pass, without building a
+    2D mask first.
+
+    Parameters:
+    -----------
+    values : np.array
+        2D float64 array of the numeric columns to check.
+
+    Returns:
+    --------
+    np.array
+        Boolean array that is True for the rows of ``values`` without missing values.
+    """
+    n_rows, n_cols = values.shape
+    mask = np.empty(n_rows, dtype=np.bool_)
+    for i in range(n_rows):
+        complete = True
+        for j in range(n_cols):
+            if not np.isfinite(values[i, j]):
+                complete = False
+                break
+        mask[i] = complete
+    return mask
@@ -1,9 +1,138 @@
-import matplotlib
-import matplotlib.pyplot as plt
+import math
+import operator
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Union
+
 import pandas as pd
 import numpy as np
-from scipy.integrate import cumtrapz
-from scipy.optimize import least_squares, differential_evolution, minimize
+from numba import njit
+from scipy.optimize import OptimizeResult, least_squares, differential_evolution, minimize
+
+if TYPE_CHECKING:
+    from matplotlib.figure import Figure
+
+# Conversion is kept strictly inside (0, 1), so alpha ** m never sees 0 and the logarithms in the
+# analytic derivatives stay finite.
+_ALPHA_MIN = 1e-30
+_ALPHA_MAX = np.nextafter(1.0, 0.0)
+
+# Marks the arrays of a Models instance as not prepared for any heating rate yet.
+_NOT_PREPARED = object()
+
+
+@njit(cache=True, fastmath=True, nogil=True)
+def _rrm_kernel(A: float, n: float, m: float, alpha_zv: float, Delta_q: float, arrhenius: np.array,
+                alpha: np.array, out: np.array) -> np.array:
+    """
+    Evaluates the reaction rate model element by element in a single fused loop,
+    given the precomputed Arrhenius factor exp(-Ea/(RT)).
+
+    The result is written into the preallocated ``out`` array, which is also returned.
+    """
+    for i in range(alpha.size):
+        a = alpha[i]
+        out[i] = Delta_q * A * (1 - a) ** n * (a ** m + alpha_zv) * arrhenius[i]
+    return out
+
+
+@njit(cache=True)
+def _cumtrap(y: np.array, x: np.array, out: np.array) -> np.array:
+    """
+    Cumulatively integrates y(x) using the trapezoidal rule, starting from zero.
+
+    The running sum is accumulated in a single pass and written into ``out``, which is also returned.
+    """
+    acc = 0.0
+    out[0] = 0.0
+    for i in range(1, y.size):
+        acc += 0.5 * (y[i] + y[i - 1]) * (x[i] - x[i - 1])
+        out[i] = acc
+    return out
+
+
+@njit(cache=True, fastmath=True, nogil=True)
+def _loss_grad_kernel(A: float, Ea: float, n: float, m: float, alpha_zv: float, Delta_q: float,
+                      neg_inv_RT: np.array, alpha: np.array, HRR: np.array, grad: np.array) -> float:
+    """
+    Computes the sum of squared residuals and accumulates its analytic gradient with respect to
+    [A, logEa, n, m, alpha_zv] into ``grad`` in the same pass over the data.
+    """
+    loss = 0.0
+    grad[:] = 0.0
+    for i in range(alpha.size):
+        a = alpha[i]
+        b = 1 - a
+        x = Ea * neg_inv_RT[i]
+        base = Delta_q * b ** n * math.exp(x)
+        a_m = a ** m
+        rate = A * base * (a_m + alpha_zv)
+        r = rate - HRR[i]
+        loss += r * r
+        r2 = 2.0 * r
+        grad[0] += r2 * base * (a_m + alpha_zv)
+        grad[1] += r2 * rate * x
+        grad[2] += r2 * rate * math.log(b)
+        grad[3] += r2 * A * base * a_m * math.log(a)
+        grad[4] += r2 * A * base
+    return loss
+
+
+@njit(cache=True, fastmath=True, nogil=True)
+def _profiled_sum_of_squares_batch(params: np.array, A_min: float, A_max: float, Delta_q: float,
+                                   neg_inv_RT: np.array, alpha: np.array, one_minus_alpha: np.array, HRR: np.array,
+                                   A_opt: np.array) -> np.array:
+    """
+    Computes the sum of squared residuals for every column of a (4, S) array of [logEa, n, m, alpha_zv],
+    as passed by differential evolution with vectorized=True.
+
+    The rate is linear in A, so for each column the least-squares optimal A is found in closed form,
+    clipped to [A_min, A_max] and stored in ``A_opt``. The element-wise arithmetic runs in the dtype of
+    the inputs, so float32 arrays get single precision SIMD, while the sums are accumulated in float64.
+    """
+    loss = np.empty(params.shape[1])
+    unit_rate = np.empty_like(alpha)
+    for j in range(params.shape[1]):
+        Ea = math.exp(params[0, j])
+        n = params[1, j]
+        m = params[2, j]
+        alpha_zv = params[3, j]
+        uu = 0.0
+        uh = 0.0
+        for i in range(alpha.size):
+            u = Delta_q * one_minus_alpha[i] ** n * (alpha[i] ** m + alpha_zv) * math.exp(Ea * neg_inv_RT[i])
+            unit_rate[i] = u
+            uu += u * u
+            uh += u * HRR[i]
+        A = uh / uu if uu > 0.0 else A_min
+        A = min(max(A, A_min), A_max)
+        acc = 0.0
+        for i in range(alpha.size):
+            r = A * unit_rate[i] - HRR[i]
+            acc += r * r
+        A_opt[j] = A
+        loss[j] = acc
+    return loss
+
+
+@njit(cache=True, fastmath=True, nogil=True)
+def _jac_kernel(A: float, Ea: float, n: float, m: float, alpha_zv: float, Delta_q: float, neg_inv_RT: np.array,
+                arrhenius: np.array, alpha: np.array, jac: np.array) -> np.array:
+    """
+    Fills the (N, 5) array ``jac`` with the partial derivatives of the rate with respect to
+    [A, logEa, n, m, alpha_zv] and returns it.
+    """
+    for i in range(alpha.size):
+        a = alpha[i]
+        b = 1 - a
+        base = Delta_q * b ** n * arrhenius[i]
+        a_m = a ** m
+        rate = A * base * (a_m + alpha_zv)
+        jac[i, 0] = base * (a_m + alpha_zv)
+        jac[i, 1] = rate * Ea * neg_inv_RT[i]
+        jac[i, 2] = rate * math.log(b)
+        jac[i, 3] = A * base * a_m * math.log(a)
+        jac[i, 4] = A * base
+    return jac
 
 
 class Models:
@@ -26,22 +155,32 @@ class Models:
     __init__(data: pandas.DataFrame, heating_rate: float)
         Initializes the Models class with experimental data and heating rate.
 
-    reaction_rate_model(params: list, T: np.array, HRR: np.array, Delta_q: float) -> np.array
+    reaction_rate_model(params: list) -> np.array
         Computes the predicted heat release rate based on the reaction rate model.
 
-    loss_function(params: list, T: np.array, HRR: np.array, Delta_q: float) -> float
+    loss_function(params: list) -> float
         Calculates the loss (sum of squared residuals) between the model predictions and the experimental data.
 
-    residuals(params: list, T: np.array, HRR: np.array, Delta_q: float) -> np.array
+    residuals(params: list) -> np.array
         Computes the residuals between the model predictions and the experimental HRR data.
 
-    process(method: str, bounds: dict, initial_guess: list) -> list
+    loss_and_gradient(params: list) -> tuple
+        Calculates the loss and its analytic gradient with respect to the model parameters in one pass.
+
+    jacobian(params: list) -> np.array
+        Computes the analytic Jacobian of the residuals with respect to the model parameters.
+
+    process(method: Union[int, str], bounds: np.array, initial_guess: list) -> list
         Processes the experimental data, optimizes the model parameters, and fits the model to the data.
 
-    draw() -> matplotlib.figure.Figure
+    draw() -> Figure
         Plots the experimental data and the fitted model predictions.
     """
 
+    METHODS = ("minimize", "least squares", "differential evolution")
+    _METHOD_IDS = {name: method_id for method_id, name in enumerate(METHODS)}
+    _ARRHENIUS_CACHE_SIZE = 8
+
     def __init__(self, data: pd.DataFrame, heating_rate: float):
         """
         Initializes the Models class with experimental data and heating rate.
@@ -57,37 +196,58 @@ class Models:
         self.heating_rate = heating_rate
         self.optimized_parameters = None
         self.Delta_q = 0
-
-    def reaction_rate_model(self, params: list, T: np.array, HRR: np.array, Delta_q: float) -> np.array:
+        self._T = data['Temperature (C)'].to_numpy(np.float64) + 273.15
+        self._HRR = data['HRR (W/g)'].to_numpy(np.float64)
+        self._alpha = None
+        self._neg_inv_RT = None
+        self._arrhenius_cache = OrderedDict()
+        self._rate = None
+        self._HRR_f32 = None
+        self._alpha_f32 = None
+        self._one_minus_alpha_f32 = None
+        self._neg_inv_RT_f32 = None
+        self._prepared_for = _NOT_PREPARED
+        self._fig = None
+        self._line = None
+
+    def reaction_rate_model(self, params: list) -> np.array:
         """
         Computes the predicted heat release rate based on the reaction rate model.
 
+        The temperature, HRR and conversion arrays prepared by processing() are used,
+        so the conversion is integrated once per fit rather than on every call.
+
         Parameters:
         -----------
         params : list
             List of model parameters [A, logEa, n, m, alpha_zv].
-        T : np.array
-            Array of temperature values (in Kelvin).
-        HRR : np.array
-            Array of experimental HRR values (in W/g).
-        Delta_q : float
-            The total heat released per gram during the experiment.
 
         Returns:
         --------
         np.array
-            The predicted heat release rate.
+            The predicted heat release rate. The array is a buffer reused between calls.
         """
         A, logEa, n, m, alpha_zv = params
-        Ea = np.exp(logEa)
-        beta = self.heating_rate
-        R = 8.314
-        alpha = (1 / beta) * cumtrapz(HRR, T, initial=0) / Delta_q
-        alpha = np.clip(alpha, 0, 1)
-        rate = Delta_q * A * ((1 - alpha) ** n) * (alpha ** m + alpha_zv) * np.exp(-Ea / (R * T))
-        return rate
+        return _rrm_kernel(A, n, m, alpha_zv, self.Delta_q, self._arrhenius(logEa), self._alpha, self._rate)
+
+    def _arrhenius(self, logEa: float) -> np.array:
+        """
+        Returns the Arrhenius factor exp(-Ea/(RT)) for the given logEa.
 
-    def loss_function(self, params: list, T: np.array, HRR: np.array, Delta_q: float) -> float:
+        The last few factors are kept in a small LRU cache, so finite-difference steps in
+        A, n, m or alpha_zv reuse the array instead of recomputing the exponent.
+        """
+        arrhenius = self._arrhenius_cache.get(logEa)
+        if arrhenius is None:
+            arrhenius = np.exp(np.exp(logEa) * self._neg_inv_RT)
+            self._arrhenius_cache[logEa] = arrhenius
+            if len(self._arrhenius_cache) > self._ARRHENIUS_CACHE_SIZE:
+                self._arrhenius_cache.popitem(last=False)
+        else:
+            self._arrhenius_cache.move_to_end(logEa)
+        return arrhenius
+
+    def loss_function(self, params: list) -> float:
         """
         Calculates the loss (sum of squared residuals) between the model predictions and the experimental data.
 
@@ -95,23 +255,17 @@ class Models:
         -----------
         params : list
             List of model parameters [A, logEa, n, m, alpha_zv].
-        T : np.array
-            Array of temperature values (in Kelvin).
-        HRR : np.array
-            Array of experimental HRR values (in W/g).
-        Delta_q : float
-            The total heat released per gram during the experiment.
 
         Returns:
         --------
         float
             The loss value.
         """
-        model_predictions = self.reaction_rate_model(params, T, HRR, Delta_q)
-        residuals = model_predictions - HRR
+        model_predictions = self.reaction_rate_model(params)
+        residuals = model_predictions - self._HRR
         return np.sum(residuals ** 2)
 
-    def residuals(self, params: list, T: np.array, HRR: np.array, Delta_q: float) -> float:
+    def residuals(self, params: list) -> np.array:
         """
         Computes the residuals between the model predictions and the experimental HRR data.
 
@@ -119,31 +273,149 @@ class Models:
         -----------
         params : list
             List of model parameters [A, logEa, n, m, alpha_zv].
-        T : np.array
-            Array of temperature values (in Kelvin).
-        HRR : np.array
-            Array of experimental HRR values (in W/g).
-        Delta_q : float
-            The total heat released per gram during the experiment.
 
         Returns:
         --------
         np.array
             Array of residuals (model predictions - experimental HRR).
         """
-        model_predictions = self.reaction_rate_model(params, T, HRR, Delta_q)
-        return model_predictions - HRR
+        model_predictions = self.reaction_rate_model(params)
+        return model_predictions - self._HRR
+
+    def loss_and_gradient(self, params: list) -> tuple:
+        """
+        Calculates the loss and its analytic gradient with respect to the model parameters in one pass.
+
+        Parameters:
+        -----------
+        params : list
+            List of model parameters [A, logEa, n, m, alpha_zv].
+
+        Returns:
+        --------
+        tuple
+            The loss value and the gradient array.
+        """
+        A, logEa, n, m, alpha_zv = params
+        Ea = np.exp(logEa)
+        grad = np.empty(5)
+        loss = _loss_grad_kernel(A, Ea, n, m, alpha_zv, self.Delta_q, self._neg_inv_RT, self._alpha, self._HRR, grad)
+        return loss, grad
+
+    def jacobian(self, params: list) -> np.array:
+        """
+        Computes the analytic Jacobian of the residuals with respect to the model parameters.
+
+        Parameters:
+        -----------
+        params : list
+            List of model parameters [A, logEa, n, m, alpha_zv].
+
+        Returns:
+        --------
+        np.array
+            Array of shape (N, 5) with the partial derivatives of the predicted heat release rate.
+        """
+        A, logEa, n, m, alpha_zv = params
+        jac = np.empty((self._alpha.size, 5))
+        return _jac_kernel(A, np.exp(logEa), n, m, alpha_zv, self.Delta_q, self._neg_inv_RT, self._arrhenius(logEa),
+                           self._alpha, jac)
+
+    def _population_loss(self, params: np.array, A_bounds: np.array, A_opt: np.array = None) -> np.array:
+        """
+        Computes the loss of a whole (4, S) differential evolution population of [logEa, n, m, alpha_zv]
+        in single precision, with A profiled out in closed form. The optimal A of each member is
+        written into ``A_opt`` when it is given.
+        """
+        if A_opt is None:
+            A_opt = np.empty(params.shape[1])
+        return _profiled_sum_of_squares_batch(params.astype(np.float32), A_bounds[0], A_bounds[1],
+                                              np.float32(self.Delta_q), self._neg_inv_RT_f32, self._alpha_f32,
+                                              self._one_minus_alpha_f32, self._HRR_f32, A_opt)
 
-    def processing(self, method: str, bounds: dict, initial_guess: list) -> list:
+    def _minimize(self, x0: np.array, bounds: np.array) -> OptimizeResult:
+        """
+        Runs the bounded TNC minimization from x0 using the fused loss and gradient.
+        """
+        options = {
+            'maxiter': 10000,
+            'maxfun': 50000,
+            'disp': False
+        }
+        return minimize(self.loss_and_gradient, x0, jac=True, bounds=bounds, method='TNC', options=options)
+
+    def _least_squares(self, x0: np.array, bounds: np.array) -> OptimizeResult:
+        """
+        Runs the bounded trust region least squares fit from x0 using the analytic Jacobian.
+        """
+        return least_squares(self.residuals, x0, jac=self.jacobian, bounds=tuple(bounds.T), method='trf',
+                             x_scale='jac')
+
+    def _differential_evolution(self, x0: np.array, bounds: np.array) -> OptimizeResult:
+        """
+        Runs the differential evolution search within the bounds and refines its best member with TNC.
+
+        The initial guess is not used by the search.
+        """
+        # A enters the rate linearly, so it is solved for in closed form and the search runs over the
+        # remaining four parameters only.
+        result = differential_evolution(self._population_loss, bounds[1:], args=(bounds[0],), popsize=15,
+                                        maxiter=200, tol=1e-7, init='sobol', polish=False, updating='deferred',
+                                        vectorized=True
+                                        )
+        A_opt = np.empty(1)
+        self._population_loss(result.x[:, np.newaxis], bounds[0], A_opt)
+        result.x = np.concatenate((A_opt, result.x))
+        polished = self._minimize(result.x, bounds)
+        if polished.fun < result.fun:
+            result = polished
+        return result
+
+    # Indexed by the method id, in the order of METHODS.
+    _FITTERS = (_minimize, _least_squares, _differential_evolution)
+
+    def _prepare_arrays(self) -> None:
+        """
+        Prepares the conversion, Arrhenius and buffer arrays shared by all optimization methods.
+
+        The arrays depend only on the data and the heating rate, so repeated fits of the same
+        Models instance reuse them.
+
+        Raises:
+        -------
+        ValueError
+            If the heating rate is not known.
+        """
+        beta = self.heating_rate
+        if beta is None:
+            raise ValueError("The heating rate is missing from the file header.")
+        if self._prepared_for is not _NOT_PREPARED and self._prepared_for == beta:
+            return
+
+        cumulative_heat = _cumtrap(self._HRR, self._T, np.empty(self._T.size))
+        self.Delta_q = cumulative_heat[-1] / beta
+        self._alpha = np.clip(cumulative_heat / (beta * self.Delta_q), _ALPHA_MIN, _ALPHA_MAX)
+        R = 8.314
+        self._neg_inv_RT = -1.0 / (R * self._T)
+        self._arrhenius_cache.clear()
+        self._rate = np.empty(self._T.size)
+        self._HRR_f32 = self._HRR.astype(np.float32)
+        self._alpha_f32 = self._alpha.astype(np.float32)
+        self._one_minus_alpha_f32 = (1 - self._alpha).astype(np.float32)
+        self._neg_inv_RT_f32 = self._neg_inv_RT.astype(np.float32)
+        self._prepared_for = beta
+
+    def processing(self, method: Union[int, str], bounds: np.array, initial_guess: list) -> list:
         """
         Processes the experimental data, optimizes the model parameters, and fits the model to the data.
 
         Parameters:
         -----------
-        method : str
-            The string for optimization method to choose. Options are "minimize", "least squares", and "differential evolution".
-        bounds : dict
-            Dictionary containing the bounds for each parameter in the form {'param': (min, max)}.
+        method : int or str
+            The optimization method to choose, either as its index in METHODS or as its name. Options are
+            "minimize", "least squares", and "differential evolution".
+        bounds : np.array
+            Array of shape (5, 2) with the (min, max) bounds of [A, logEa, n, m, alpha_zv].
         initial_guess : list
             Initial guess for the model parameters.
 
@@ -152,39 +424,16 @@ class Models:
         list
             Optimized parameters [A, Ea, n, m, alpha_zv].
         """
-        beta = self.heating_rate
-
-        self.data['Temperature (K)'] = self.data['Temperature (C)'] + 273.15
-        self.Delta_q = np.trapz(self.data['HRR (W/g)'] / beta, self.data['Temperature (K)'])
-        self.data['Alpha'] = (1 / beta) * cumtrapz(self.data['HRR (W/g)'], self.data['Temperature (K)'], initial=0
-                                                   ) / self.Delta_q
-        T = self.data['Temperature (K)'].values
-        HRR = self.data['HRR (W/g)'].values
-
-        if method == "minimize":
-            bounds_list = [bounds['A'], bounds['logEa'], bounds['n'], bounds['m'], bounds['alpha_zv']]
-
-            options = {
-                'maxiter': 10000,
-                'maxfun': 50000,
-                'disp': False
-            }
-            result = minimize(self.loss_function, initial_guess, args=(T, HRR, self.Delta_q), bounds=bounds_list,
-                              method='TNC',
-                              options=options
-                              )
-        elif method == "least squares":
-            lower_bounds = [bounds['A'][0], bounds['logEa'][0], bounds['n'][0], bounds['m'][0], bounds['alpha_zv'][0]]
-            upper_bounds = [bounds['A'][1], bounds['logEa'][1], bounds['n'][1], bounds['m'][1], bounds['alpha_zv'][1]]
-            bounds_ls = (lower_bounds, upper_bounds)
-
-            result = least_squares(self.residuals, initial_guess, args=(T, HRR, self.Delta_q), bounds=bounds_ls)
-        elif method == "differential evolution":
-            bounds_list = [bounds['A'], bounds['logEa'], bounds['n'], bounds['m'], bounds['alpha_zv']]
-
-            result = differential_evolution(self.loss_function, bounds_list, args=(T, HRR, self.Delta_q))
-        else:
+        try:
+            method = self._METHOD_IDS[method] if isinstance(method, str) else operator.index(method)
+        except (KeyError, TypeError):
+            method = -1
+        if not 0 <= method < len(self._FITTERS):
             raise ValueError("Invalid optimization method selected.")
+
+        self._prepare_arrays()
+        bounds = np.asarray(bounds, dtype=np.float64)
+        result = self._FITTERS[method](self, initial_guess, bounds)
         A_fitted, logEa_fitted, n_fitted, m_fitted, alpha_zv_fitted = result.x
         Ea_fitted = np.exp(logEa_fitted)
 
@@ -192,28 +441,38 @@ class Models:
 
         return [A_fitted, Ea_fitted, n_fitted, m_fitted, alpha_zv_fitted]
 
-    def draw(self) -> matplotlib.figure.Figure:
+    def draw(self) -> 'Figure':
         """
         Plots the experimental data and the fitted model predictions.
 
+        The figure is created on the first call and reused afterwards; later calls only
+        update the fitted curve, and the caller redraws the canvas that shows the figure.
+
         Returns:
         --------
         matplotlib.figure.Figure
             Matplotlib figure object.
         """
-        T = self.data['Temperature (K)'].values
-        HRR = self.data['HRR (W/g)'].values
-        predicted_HRR = self.reaction_rate_model(self.optimized_parameters, T, HRR, self.Delta_q)
-
-        fig, ax = plt.subplots(figsize=(10, 6))
-        ax.scatter(self.data['Temperature (C)'], self.data['HRR (W/g)'], color='blue', label='Actual data')
-        ax.plot(self.data['Temperature (C)'], predicted_HRR, color='red', label='Fitted model')
-        ax.set_xlabel('Temperature (°C)')
-        ax.set_ylabel('HRR (W/g)')
-        ax.legend()
-        ax.grid(True)
+        predicted_HRR = self.reaction_rate_model(self.optimized_parameters).copy()
+
+        if self._fig is None:
+            from matplotlib.figure import Figure
+
+            self._fig = Figure(figsize=(10, 6))
+            ax = self._fig.add_subplot()
+            T_celsius = self._T - 273.15
+            ax.plot(T_celsius, self._HRR, 'o', markersize=2, color='blue', label='Actual data')
+            self._line, = ax.plot(T_celsius, predicted_HRR, color='red', label='Fitted model')
+            ax.set_xlabel('Temperature (°C)')
+            ax.set_ylabel('HRR (W/g)')
+            ax.legend()
+            ax.grid(True)
+        else:
+            self._line.set_ydata(predicted_HRR)
+            self._line.axes.relim()
+            self._line.axes.autoscale_view()
 
-        return fig
+        return self._fig
 
 
 if __name__ == "__main__":
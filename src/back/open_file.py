@@ -1,8 +1,53 @@
-from typing import Optional
+import mmap
+import re
+from typing import Iterator, Optional
 
+import numpy as np
 import pandas
 import pandas as pd
 
+from ._fast import finite_rows
+
+try:
+    import pyarrow  # noqa: F401
+    _HAS_PYARROW = True
+    _READ_CSV_OPTIONS = {'engine': 'pyarrow', 'index_col': None, 'on_bad_lines': 'skip'}
+except ImportError:
+    _HAS_PYARROW = False
+    _READ_CSV_OPTIONS = {'engine': 'c', 'index_col': False, 'float_precision': 'high'}
+
+_HEADER_BLOCK_RE = re.compile(rb'(?:[ \t]*(?:#[^\n]*)?\n)*')
+_LINE_RE = re.compile(rb'[^\n]*\n?')
+_HEADER_LINE_RE = re.compile(rb'^[ \t]*#(.*?)[ \t\r]*$', re.M)
+_HEATING_RATE_RE = re.compile(rb'^[ \t]*#Heating Rate[^:\n]*:[ \t]*([0-9.eE+-]+)', re.M)
+
+# The columns used by the fit; rows with missing values in them are dropped.
+_FIT_COLUMNS = ['Temperature (C)', 'HRR (W/g)']
+
+
+def _drop_incomplete_rows(data_frame: pd.DataFrame) -> pd.DataFrame:
+    """
+    Drops the empty columns of the data frame, such as the one produced by a tab at the end of
+    every line, and then the rows with missing values in the columns used by the fit.
+
+    Parameters:
+    -----------
+    data_frame : pandas.DataFrame
+        The data frame read from the file.
+
+    Returns:
+    --------
+    pandas.DataFrame
+        The data frame without empty columns and incomplete rows.
+    """
+    data_frame = data_frame.dropna(axis=1, how='all')
+    columns = [column for column in _FIT_COLUMNS if column in data_frame.columns]
+    if columns:
+        mask = finite_rows(np.ascontiguousarray(data_frame[columns].to_numpy(dtype=np.float64)))
+        if not mask.all():
+            data_frame = data_frame[mask].reset_index(drop=True)
+    return data_frame
+
 
 class FileProcessor:
     """
@@ -14,10 +59,14 @@ class FileProcessor:
        The path to the file to be processed.
    header : list
        A list to store the header lines from the file.
+   header_text : str
+       The header lines joined with newlines, ready for display.
    data_frame : pandas.DataFrame or None
        A DataFrame to store the file data after processing.
    heating_rate : float or None
        The heating rate value extracted from the file header.
+   column_names : list
+       The column names read from the line that follows the header.
 
    Methods:
    --------
@@ -25,7 +74,7 @@ class FileProcessor:
        Initializes the FileProcessor with an optional file path.
 
    open_file()
-       Opens the file, reads the header, and extracts the heating rate.
+       Opens the file, reads the header and the data, and extracts the heating rate.
 
    get_header() -> list
        Returns the header lines from the file.
@@ -33,6 +82,12 @@ class FileProcessor:
    get_data_frame() -> pandas.DataFrame
        Returns the data frame created from the file contents.
 
+   iter_arrays(chunk_rows: int) -> Iterator[numpy.ndarray]
+       Reads the temperature and HRR columns in chunks of rows.
+
+   get_array(chunk_rows: int = None) -> numpy.ndarray
+       Returns the temperature and HRR columns as a contiguous float64 array.
+
    get_heating_rate() -> float or None
        Returns the heating rate extracted from the file header.
     """
@@ -48,31 +103,123 @@ class FileProcessor:
         """
         self.file_path = path
         self.header = []
+        self.header_text = ""
         self.data_frame = None
         self.heating_rate = None
+        self.column_names = []
+        self._n_header_lines = 0
+        self._array = None
+        self._loaded_path = None
 
     def open_file(self) -> None:
         """
-        Opens the file, reads the header lines, and extracts the heating rate.
+        Opens the file, reads the header lines, extracts the heating rate and reads the data.
 
-        This method reads the first 11 lines of the file. Lines starting with a '#'
-        are considered as header lines. The heating rate is extracted from the
+        This method scans the leading lines of the file that start with a '#' with
+        precompiled regular expressions; they are considered as header lines, and the
+        line after them holds the column names. The heating rate is extracted from the
         header if it is present. The header is trimmed to exclude the last two lines.
+        The file is memory-mapped, and the rest of it is read into the data frame straight
+        from the mapping with the pyarrow engine. Without pyarrow, the numeric body is
+        loaded with numpy.loadtxt and wrapped into the data frame, and pandas' C parser, with
+        the column dtypes inferred, is used for files that loadtxt cannot read as all-float,
+        such as files with empty cells or text columns. Empty columns, and rows with missing temperature
+        or HRR values, such as a last line cut short, are dropped. Nothing is re-read if the
+        file path has not changed.
+        """
+        if self._loaded_path == self.file_path:
+            return
+
+        with open(self.file_path, 'rb') as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            data_offset = self._read_header(mm)
+            values = None
+            if not _HAS_PYARROW:
+                try:
+                    values = np.loadtxt(self.file_path, dtype=np.float64, delimiter='\t',
+                                        skiprows=self._n_header_lines + 1, ndmin=2)
+                except ValueError:
+                    pass
+
+            if values is None:
+                mm.seek(data_offset)
+                data_frame = pd.read_csv(mm, sep='\t', header=None, names=self.column_names, **_READ_CSV_OPTIONS)
+            else:
+                data_frame = pd.DataFrame(values, columns=self.column_names, copy=False)
+
+        self.data_frame = _drop_incomplete_rows(data_frame)
+        self._array = None
+
+        self._loaded_path = self.file_path
+
+    def _read_header(self, mm: mmap.mmap) -> int:
+        """
+        Reads the header lines, the heating rate and the column names from the mapped file.
+
+        Parameters:
+        -----------
+        mm : mmap.mmap
+            The memory-mapped file.
+
+        Returns:
+        --------
+        int
+            The offset of the first data line.
+        """
+        block_end = _HEADER_BLOCK_RE.match(mm).end()
+        block = mm[:block_end]
+        self._n_header_lines = block.count(b'\n')
+        self.header = [match.group(1).decode('utf-8', 'replace') for match in _HEADER_LINE_RE.finditer(block)]
+        heating_rate = _HEATING_RATE_RE.search(block)
+        self.heating_rate = float(heating_rate.group(1)) if heating_rate else None
+
+        if len(self.header) > 2:
+            self.header = self.header[:-2]
+        self.header_text = "\n".join(self.header)
+
+        columns_line = _LINE_RE.match(mm, block_end)
+        column_names = columns_line.group().rstrip(b'\r\n').decode('utf-8', 'replace').split('\t')
+
+        # The names are matched to the width of the first data row, so a trailing tab on either
+        # the column names line or the data lines does not shift the columns.
+        first_row = _LINE_RE.match(mm, columns_line.end()).group().rstrip(b'\r\n')
+        if first_row:
+            width = first_row.count(b'\t') + 1
+            while len(column_names) > width and not column_names[-1]:
+                column_names.pop()
+            column_names += [f"Unnamed: {i}" for i in range(len(column_names), width)]
+        self.column_names = column_names
+        return columns_line.end()
+
+    def iter_arrays(self, chunk_rows: int) -> Iterator[np.ndarray]:
         """
-        with open(self.file_path, 'r', encoding='utf-8') as file:
-            self.header = []
+        Reads the temperature and HRR columns in chunks of rows, without building a data frame
+        for the whole file.
 
-            for _ in range(11):
-                line = file.readline().strip()
-                if line.startswith("#"):
-                    line = line[1:]
-                    self.header.append(line)
-                    if line.startswith("Heating Rate"):
-                        _, value = line.split(":")
-                        self.heating_rate = float(value.strip())
+        The header is read as in open_file(), and the two columns of each chunk are converted to
+        a float64 array with incomplete rows dropped, so only one chunk of parsed text is held
+        at a time.
 
-            if len(self.header) > 2:
-                self.header = self.header[:-2]
+        Parameters:
+        -----------
+        chunk_rows : int
+            The number of file rows per chunk.
+
+        Yields:
+        -------
+        numpy.ndarray
+            A float64 array of shape (rows, 2) with up to chunk_rows rows of the temperature
+            and HRR columns.
+        """
+        with open(self.file_path, 'rb') as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            mm.seek(self._read_header(mm))
+            # usecols is not passed: the C parser rejects a last chunk made only of a row cut short
+            # when it is set, while without it the missing cells are read as NaN and dropped below.
+            with pd.read_csv(mm, sep='\t', header=None, names=self.column_names, index_col=False,
+                             dtype=dict.fromkeys(_FIT_COLUMNS, np.float64), chunksize=chunk_rows, engine='c',
+                             float_precision='high') as reader:
+                for chunk in reader:
+                    values = np.ascontiguousarray(chunk[_FIT_COLUMNS].to_numpy())
+                    yield values[finite_rows(values)]
 
     def get_header(self) -> list:
         """
@@ -90,17 +237,46 @@ class FileProcessor:
         """
         Returns the data frame created from the file contents.
 
-        The data frame is created by reading the file with pandas read_csv method,
-        starting from the 11th line.
+        The data frame is read by open_file() together with the header,
+        starting from the line after the column names.
 
         Returns:
         --------
         pandas.DataFrame
             The data frame containing the file contents.
         """
-        self.data_frame = pd.read_csv(self.file_path, sep='	', header=10, index_col=None)
+        self.open_file()
         return self.data_frame
 
+    def get_array(self, chunk_rows: Optional[int] = None) -> np.ndarray:
+        """
+        Returns the temperature and HRR columns as a contiguous float64 array.
+
+        The array is taken from the data frame read by open_file() on the first call. If
+        chunk_rows is given and the file has not been loaded yet, the array is instead
+        assembled from iter_arrays(), which keeps the peak memory of reading a long file
+        bounded.
+
+        Parameters:
+        -----------
+        chunk_rows : int, optional
+            The number of file rows per chunk (default is None, read the whole file at once).
+
+        Returns:
+        --------
+        numpy.ndarray
+            Array of shape (rows, 2) with the temperature and HRR columns.
+        """
+        if chunk_rows is not None and self._loaded_path != self.file_path:
+            chunks = list(self.iter_arrays(chunk_rows))
+            if not chunks:
+                return np.empty((0, len(_FIT_COLUMNS)))
+            return np.concatenate(chunks)
+        self.open_file()
+        if self._array is None:
+            self._array = np.ascontiguousarray(self.data_frame[_FIT_COLUMNS].to_numpy(dtype=np.float64))
+        return self._array
+
     def get_heating_rate(self) -> Optional[float]:
         """
         Returns the heating rate extracted from the file header.
@@ -1,6 +1,6 @@
 import tkinter as tk
+from concurrent.futures import Future, ThreadPoolExecutor
 from tkinter import filedialog, scrolledtext, Toplevel, messagebox
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 from typing import Union
 from tkinter import ttk
 import numpy as np
@@ -23,6 +23,9 @@ class App:
     __init__(self, root: tk.Tk, file_processor: Union[str, FileProcessor])
         Initializes the App with the window and sets up the GUI components.
 
+    select_method(self, event: tk.Event = None) -> None
+        Stores the id of the optimization method chosen in the combobox.
+
     toggle_custom_params(self)
         Toggles the visibility of the custom parameters frame.
 
@@ -33,12 +36,26 @@ class App:
         Retrieves custom bounds and initial conditions from the GUI inputs.
 
     processing(self) -> None
-        Processes the loaded data using the Models class and displays the result in the result_text widget.
+        Starts processing the loaded data using the Models class in a worker thread.
+
+    _poll_processing(self, future: Future) -> None
+        Waits for the worker thread and displays the result in the result_text widget.
 
     plot_data(self)
         Plots the processed data if available.
+
+    close(self) -> None
+        Cancels the queued fits and closes the application window.
+
+    _close_plot(self) -> None
+        Closes the plot window.
     """
 
+    PARAM_LABELS = ('A', 'Ea', 'n', 'm', 'alpha_zv')
+    DEFAULT_BOUNDS = np.array([[1e10, 1e12], [4e3, 4e5], [0, 5], [0, 5], [-1, 1]])
+    DEFAULT_INITIALS = np.array([1e11, 1e4, 1, 1, 0.3])
+    _RESULT_TEMPLATE = "A = {0:.3e}\nEa = {1:.3e}\nn = {2:.5f}\nm = {3:.5f}\nalpha = {4:.5f}".format
+
     def __init__(self, root: tk.Tk, file_processor: Union[str, FileProcessor]):
         """
         Initializes the App with the window.
@@ -51,11 +68,16 @@ class App:
             An instance of the FileProcessor class for handling file operations.
         """
         self.models = None
+        self._plot_window = None
+        self._plot_canvas = None
         self.data_frame = None
         self.heating_rate = None
 
         self.root = root
         self.file_processor = file_processor
+        self._show_error = messagebox.showinfo
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        self.root.protocol("WM_DELETE_WINDOW", self.close)
 
         self.root.title("Пиролиз")
 
@@ -65,8 +87,10 @@ class App:
         self.header_text = scrolledtext.ScrolledText(root, wrap=tk.WORD, width=60, height=9)
         self.header_text.pack(pady=10)
 
-        self.method_combobox = ttk.Combobox(root, values=["minimize", "least squares", "differential evolution"])
-        self.method_combobox.set("minimize")
+        self.method_id = 0
+        self.method_combobox = ttk.Combobox(root, values=Models.METHODS, state='readonly')
+        self.method_combobox.current(self.method_id)
+        self.method_combobox.bind('<<ComboboxSelected>>', self.select_method)
         self.method_combobox.pack(pady=5)
 
         self.custom_params_frame_visible = False
@@ -78,31 +102,28 @@ class App:
         self.custom_params_frame = tk.Frame(root)
         self.custom_params_frame.pack(pady=5)
 
-        self.bounds_entries = {}
-        self.initial_entries = {}
-        param_labels = ['A', 'Ea', 'n', 'm', 'alpha_zv']
-        default_bounds = [(1e10, 1e12), (4 * 1e3, 4 * 1e5), (0, 5), (0, 5), (-1, 1)]
-        default_initials = [1e11, 1e4, 1, 1, 0.3]
+        self.bounds_entries = []
+        self.initial_entries = []
 
-        for i, label in enumerate(param_labels):
+        for i, label in enumerate(self.PARAM_LABELS):
             tk.Label(self.custom_params_frame, text=f"{label} min:").grid(row=i, column=0, padx=5, pady=2)
             min_entry = tk.Entry(self.custom_params_frame)
             min_entry.grid(row=i, column=1, padx=5, pady=2)
-            min_entry.insert(0, default_bounds[i][0])
+            min_entry.insert(0, self.DEFAULT_BOUNDS[i, 0])
 
             tk.Label(self.custom_params_frame, text=f"{label} max:").grid(row=i, column=2, padx=5, pady=2)
             max_entry = tk.Entry(self.custom_params_frame)
             max_entry.grid(row=i, column=3, padx=5, pady=2)
-            max_entry.insert(0, default_bounds[i][1])
+            max_entry.insert(0, self.DEFAULT_BOUNDS[i, 1])
 
-            self.bounds_entries[label] = (min_entry, max_entry)
+            self.bounds_entries.append((min_entry, max_entry))
 
             tk.Label(self.custom_params_frame, text=f"{label} initial:").grid(row=i, column=4, padx=5, pady=2)
             initial_entry = tk.Entry(self.custom_params_frame)
             initial_entry.grid(row=i, column=5, padx=5, pady=2)
-            initial_entry.insert(0, default_initials[i])
+            initial_entry.insert(0, self.DEFAULT_INITIALS[i])
 
-            self.initial_entries[label] = initial_entry
+            self.initial_entries.append(initial_entry)
 
         self.custom_params_frame.pack_forget()
         self.processing_button = tk.Button(root, text="Обработать данные", command=self.processing, state=tk.DISABLED)
@@ -115,6 +136,14 @@ class App:
         self.plot_button.pack(pady=10)
         self.plot_button.config(state=tk.DISABLED)
 
+    def select_method(self, event: tk.Event = None) -> None:
+        """
+        Stores the id of the optimization method chosen in the combobox, in the order of Models.METHODS.
+
+        Returns: None
+        """
+        self.method_id = self.method_combobox.current()
+
     def toggle_custom_params(self) -> None:
         """
         Toggles the visibility of the custom_params_frame.
@@ -138,9 +167,8 @@ class App:
         file_path = filedialog.askopenfilename(filetypes=[("Text files", "*.txt"), ("All files", "*.*")])
         if file_path:
             self.file_processor.file_path = file_path
-            header = self.file_processor.get_header()
-            self.header_text.delete(1.0, tk.END)
-            self.header_text.insert(tk.INSERT, '\n'.join(header))
+            self.file_processor.open_file()
+            self.header_text.replace('1.0', tk.END, self.file_processor.header_text)
 
             self.data_frame = self.file_processor.get_data_frame()
             self.heating_rate = self.file_processor.get_heating_rate()
@@ -153,57 +181,125 @@ class App:
         Returns:
         --------
         tuple
-            Dictionary containing custom bounds and list of initial conditions.
+            Array of shape (5, 2) with the custom bounds and array of initial conditions,
+            both with Ea in log scale.
         """
-        custom_bounds = {}
-        custom_initials = []
-        for param, (min_entry, max_entry) in self.bounds_entries.items():
-            custom_bounds[param] = (float(min_entry.get()), float(max_entry.get()))
-
-        for param, initial_entry in self.initial_entries.items():
-            custom_initials.append(float(initial_entry.get()))
+        custom_bounds = np.array([[float(min_entry.get()), float(max_entry.get())]
+                                  for min_entry, max_entry in self.bounds_entries])
+        custom_initials = np.fromiter((float(entry.get()) for entry in self.initial_entries),
+                                      dtype=np.float64, count=len(self.initial_entries))
 
-        custom_initials[1] = np.log(custom_initials[1])
-        custom_bounds['logEa'] = (np.log(custom_bounds['Ea'][0]), np.log(custom_bounds['Ea'][1]))
-        custom_bounds['A'] = (custom_bounds['A'][0], custom_bounds['A'][1])
+        log_Ea = np.log([custom_initials[1], custom_bounds[1, 0], custom_bounds[1, 1]])
+        custom_initials[1] = log_Ea[0]
+        custom_bounds[1] = log_Ea[1:]
 
         return custom_bounds, custom_initials
 
     def processing(self) -> None:
         """
-        Processes the loaded data using the Models class and displays the result in the result_text widget.
+        Starts processing the loaded data using the Models class.
+
+        The GUI inputs are read here, and the fit runs in a worker thread so that the
+        window stays responsive. The buttons are disabled until the result is displayed
+        by _poll_processing().
 
         Returns: None
         """
         try:
-            method = self.method_combobox.get()
             custom_bounds, custom_initials = self.get_custom_bounds_and_initials()
+        except ValueError as e:
+            self._show_error("Ошибка", str(e))
+            return
 
+        if self.models is None or self.models.data is not self.data_frame:
             self.models = Models(self.data_frame, self.heating_rate)
-            result = self.models.processing(method, custom_bounds, custom_initials)
-            if result:
-                result_str = f"A = {result[0]:.3e}\nEa = {result[1]:.3e}\nn = {result[2]:.5f}\nm = {result[3]:.5f}\nalpha = {result[4]:.5f}"
-                self.result_text.delete(1.0, tk.END)
-                self.result_text.insert(tk.INSERT, result_str)
-                self.plot_button.config(state=tk.NORMAL)
-            else:
-                tk.messagebox.showinfo("Данные не обработаны!")
-        except ValueError as e:
-            tk.messagebox.showinfo("Ошибка", str(e))
+
+        for button in (self.open_button, self.processing_button, self.plot_button):
+            button.config(state=tk.DISABLED)
+        future = self._executor.submit(self.models.processing, self.method_id, custom_bounds, custom_initials)
+        self.root.after(50, self._poll_processing, future)
+
+    def _poll_processing(self, future: Future) -> None:
+        """
+        Displays the result of the worker thread in the result_text widget once it is done.
+
+        Parameters:
+        -----------
+        future : Future
+            The running Models.processing call.
+
+        Returns: None
+        """
+        if not future.done():
+            self.root.after(50, self._poll_processing, future)
+            return
+
+        self.open_button.config(state=tk.NORMAL)
+        self.processing_button.config(state=tk.NORMAL)
+        if self.models.optimized_parameters is not None:
+            self.plot_button.config(state=tk.NORMAL)
+
+        try:
+            result = future.result()
+        except Exception as e:
+            self._show_error("Ошибка", str(e))
+            return
+
+        if not result:
+            self._show_error("Данные не обработаны!")
+            return
+
+        result_str = self._RESULT_TEMPLATE(*result)
+        self.result_text.delete(1.0, tk.END)
+        self.result_text.insert(tk.INSERT, result_str)
 
     def plot_data(self) -> None:
         """
         Plots the processed data if available.
 
+        The plot window and its canvas are kept while the window is open, so later calls
+        redraw the same window; a new one is opened only for a new figure.
+
         Returns: None
         """
-        if hasattr(self, 'models') and self.models.optimized_parameters is not None:
-            plot_window = tk.Toplevel(self.root)
-            plot_window.title("График")
-            plot_window.geometry("800x600+200+200")
-
+        if self.models is not None and self.models.optimized_parameters is not None:
             fig = self.models.draw()
 
-            canvas = FigureCanvasTkAgg(fig, master=plot_window)
-            canvas.draw()
-            canvas.get_tk_widget().pack(side=tk.TOP, fill=tk.BOTH, expand=1)
+            if self._plot_canvas is None or self._plot_canvas.figure is not fig:
+                from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+
+                self._close_plot()
+                self._plot_window = tk.Toplevel(self.root)
+                self._plot_window.title("График")
+                self._plot_window.geometry("800x600+200+200")
+                self._plot_window.protocol("WM_DELETE_WINDOW", self._close_plot)
+
+                self._plot_canvas = FigureCanvasTkAgg(fig, master=self._plot_window)
+                self._plot_canvas.get_tk_widget().pack(side=tk.TOP, fill=tk.BOTH, expand=1)
+            else:
+                self._plot_window.lift()
+            self._plot_canvas.draw()
+
+    def close(self) -> None:
+        """
+        Cancels the queued fits and closes the application window.
+
+        The executor is shut down without waiting, so the window closes at once, but a fit that
+        is already running cannot be interrupted: it runs to completion, and the interpreter
+        waits for it before the process exits.
+
+        Returns: None
+        """
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self.root.destroy()
+
+    def _close_plot(self) -> None:
+        """
+        Closes the plot window, if it is open, and forgets its canvas.
+
+        Returns: None
+        """
+        if self._plot_window is not None:
+            self._plot_window.destroy()
+        self._plot_window = None
+        self._plot_canvas = None